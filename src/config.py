@@ -1,16 +1,98 @@
 import os
-import json
+from types import MappingProxyType
 
 """ Configuration file for parsing environment variables into Python variables 
 used by other modules """
 
 
+# production vs dev paths are invariant for the life of the process;
+# resolve them once at import instead of per get_settings call
+_SRC_DIR = os.path.dirname(__file__)
+_TEMP_FOLDER_PROD = "/tmp"
+_TEMP_FOLDER_DEV = _SRC_DIR
+_CHROME_PATH_PROD = "/opt/chrome/chrome"
+_CHROME_PATH_DEV = os.path.join(_SRC_DIR, "chrome-dev", "chrome.exe")
+_CHROME_DRIVER_PATH_PROD = "/opt/chromedriver"
+_CHROME_DRIVER_PATH_DEV = os.path.join(_SRC_DIR, "chrome-dev", "chromedriver.exe")
+
+# settings sourced from the event (falling back to the environment)
+_STRING_SETTING_KEYS = (
+    "MODE",
+    "SINGLE_USER_USERNAME",
+    "SINGLE_USER_PASSWORD",
+    "SINGLE_USER_CSV",
+    "MULTI_USER_CSV",
+    "AWS_S3_REGION",
+    "AWS_S3_BUCKET",
+    "AWS_LAMBDA_ARN",
+    "AWS_LAMBDA_ECR_IMAGE_URI",
+    "FILE_SOURCE",
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "CREDENTIALS_FILE",
+)
+
+def _build_base_settings():
+    """Parse the environment once into the immutable base settings mapping.
+    The environment cannot change under a running container/Lambda process,
+    so this runs exactly once at import; get_settings then only has to
+    overlay per-event overrides. The read-only proxy guarantees nothing can
+    mutate the shared base the way a frozen settings object would.
+    """
+    # snapshot the environment into a plain dict once; os.environ.get goes
+    # through the _Environ key-encoding wrapper on every call, a plain dict
+    # lookup does not
+    env = dict(os.environ)
+    production = env.get("PRODUCTION", "0") == "1"
+    return MappingProxyType(
+        {
+            # strings
+            **{x: env.get(x) for x in _STRING_SETTING_KEYS},
+            # ints
+            "WEBDRIVER_TIMEOUT_SECONDS": int(
+                env.get("WEBDRIVER_TIMEOUT_SECONDS", "120")
+            ),
+            "WEBDRIVER_UPLOAD_TIMEOUT_SECONDS": int(
+                env.get("WEBDRIVER_UPLOAD_TIMEOUT_SECONDS", "120")
+            ),
+            # workers for parallel multi_user dispatch; 1 = sequential
+            "MAX_WORKERS": int(env.get("MAX_WORKERS", "1")),
+            # S3 multipart transfer tuning (bytes / thread count)
+            "S3_TRANSFER_CHUNKSIZE": int(
+                env.get("S3_TRANSFER_CHUNKSIZE", str(16 * 1024 * 1024))
+            ),
+            "S3_TRANSFER_CONCURRENCY": int(
+                env.get("S3_TRANSFER_CONCURRENCY", "16")
+            ),
+            # bools
+            "VERBOSE": env.get("VERBOSE", "0") == "1",
+            # success responses only carry the public IP (an outbound HTTP
+            # lookup) when explicitly requested; error responses always do
+            "INCLUDE_IP_IN_RESPONSE": env.get("INCLUDE_IP_IN_RESPONSE", "0")
+            == "1",
+            "PRODUCTION": production,
+            # constants
+            "TEMP_FOLDER": _TEMP_FOLDER_PROD if production else _TEMP_FOLDER_DEV,
+            "CHROME_PATH": _CHROME_PATH_PROD if production else _CHROME_PATH_DEV,
+            "CHROME_DRIVER_PATH": _CHROME_DRIVER_PATH_PROD
+            if production
+            else _CHROME_DRIVER_PATH_DEV,
+        }
+    )
+
+
+_BASE_SETTINGS = _build_base_settings()
+
+
 def get_settings(event: dict = {}):
     """
     Try to pull settings from Lambda event first. If not
     present in event, then use environment variables.
     This gives the option of passing the driving arguments
     either via environment variables or via event keys.
+    The environment-derived base is parsed once at import; each call just
+    overlays the event's overrides on a fresh copy, so callers can freely
+    mutate the returned dict (e.g. settings["ENV"]).
     args:
     event (dict) - lambda event
     returns:
@@ -18,47 +100,7 @@ def get_settings(event: dict = {}):
     with priority given to the event in case a variable is defined by
     both the environment and the event
     """
-    settings = {
-        x: os.environ.get(x, None) if not event.get(x, None) else event.get(x, None)
-        for x in [
-            "MODE",
-            "SINGLE_USER_USERNAME",
-            "SINGLE_USER_PASSWORD",
-            "SINGLE_USER_CSV",
-            "MULTI_USER_CSV",
-            "AWS_S3_REGION",
-            "AWS_S3_BUCKET",
-            "AWS_LAMBDA_ARN",
-            "AWS_LAMBDA_ECR_IMAGE_URI",
-            "FILE_SOURCE",
-            "AWS_ACCESS_KEY_ID",
-            "AWS_SECRET_ACCESS_KEY",
-            "CREDENTIALS_FILE",
-        ]
-    }
-
-    # now handle the ints
-    settings = settings | {
-        "WEBDRIVER_TIMEOUT_SECONDS": int(
-            os.environ.get("WEBDRIVER_TIMEOUT_SECONDS", "120")
-        ),
-        "WEBDRIVER_UPLOAD_TIMEOUT_SECONDS": int(
-            os.environ.get("WEBDRIVER_UPLOAD_TIMEOUT_SECONDS", "120")
-        ),
-    }
-    # handle bools
-    settings = settings | {
-        x: os.environ.get(x, "0") == "1" for x in ["VERBOSE", "PRODUCTION"]
-    }
-
-    # handle constants
-    settings = settings | {
-        "TEMP_FOLDER": "/tmp" if settings["PRODUCTION"] else os.path.dirname(__file__),
-        "CHROME_PATH": "/opt/chrome/chrome"
-        if settings["PRODUCTION"]
-        else os.path.join(os.path.dirname(__file__), "chrome-dev", "chrome.exe"),
-        "CHROME_DRIVER_PATH": "/opt/chromedriver"
-        if settings["PRODUCTION"]
-        else os.path.join(os.path.dirname(__file__), "chrome-dev", "chromedriver.exe"),
+    return {
+        **_BASE_SETTINGS,
+        **{x: event[x] for x in _STRING_SETTING_KEYS if event.get(x)},
     }
-    return settings
@@ -1,14 +1,95 @@
-import logging
-import os
+import atexit
 import csv
-import subprocess
-import time
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from selenium.common.exceptions import TimeoutException
+import bizbuysell
 from bizbuysell import BizBuySellAutomator
+import log
 from log import BaseLogger
 from net import NetworkUtility
 
 
+# MODE (and MODE+FILE_SOURCE pairs) -> settings keys that must be present
+# before any automator or driver work starts; built once at import so the
+# handlers never rebuild per-call validation lists
+_REQUIRED_SETTINGS = {
+    "single_user": (
+        "SINGLE_USER_USERNAME",
+        "SINGLE_USER_PASSWORD",
+        "SINGLE_USER_CSV",
+    ),
+    "multi_user": ("MULTI_USER_CSV",),
+    ("multi_user", "s3"): ("AWS_S3_BUCKET", "AWS_S3_REGION"),
+}
+_REQUIRED_HINTS = {
+    "multi_user": " - csv should include username,password,csv_path as columns",
+}
+# pre-merge the MODE+FILE_SOURCE entries with their mode's base keys so
+# _validate is a single dict lookup with no per-call tuple concatenation
+for _combo in [k for k in _REQUIRED_SETTINGS if isinstance(k, tuple)]:
+    _REQUIRED_SETTINGS[_combo] = (
+        _REQUIRED_SETTINGS[_combo[0]] + _REQUIRED_SETTINGS[_combo]
+    )
+del _combo
+
+
+# settings the AWS clients capture at construction; when a per-event
+# override changes any of them, the automator's cached clients must be
+# rebuilt or the override is silently ignored
+_CLIENT_SETTINGS_KEYS = (
+    "AWS_S3_REGION",
+    "AWS_S3_BUCKET",
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+)
+
+
+def _init_pool_worker() -> None:
+    """Run once in each pool worker before it takes any tasks. Forked
+    workers inherit the parent's module globals, including any driver
+    parked in the warm cache; init_driver's STATUS probe would succeed
+    against it (it is just HTTP to the parent's chromedriver) and every
+    worker would adopt the parent's one Chrome session. Drop the inherited
+    handle so each worker launches its own browser.
+
+    The logging globals are inherited too, but the parent's QueueListener
+    thread is not - records enqueued on the inherited queue would be lost.
+    Reset them so this worker's loggers spin up their own listener."""
+    bizbuysell._WARM_DRIVER = None
+    log._reset_after_fork()
+
+
+def _run_one_user(settings: dict, user_row: dict, csv_file_path: str = "") -> str:
+    """Worker for parallel multi_user execution. Runs in its own process, so
+    it builds its own automator (and therefore its own WebDriver) rather than
+    sharing the parent's; Chrome sessions cannot be shared across processes.
+    Args:
+    settings (dict) - settings dict from the parent Driver
+    user_row (dict) - one username,password,csv_path row from the multi-user CSV
+    csv_file_path (str) - local path to an already-downloaded copy of the
+    user's CSV; when set the worker skips its own download
+    Returns:
+    username (str) - the username whose session completed
+    """
+    automator = BizBuySellAutomator(settings=settings)
+    automator.init_driver()
+    try:
+        automator.automate_single_user_session(
+            username=user_row["username"],
+            password=user_row["password"],
+            csv_path=user_row["csv_path"],
+            csv_file_path=csv_file_path,
+        )
+    finally:
+        # force teardown rather than parking: workers are recycled across
+        # tasks and exit without atexit cleanup at pool shutdown, so a
+        # parked driver here would leak one running Chrome per row
+        automator.quit(force=True)
+    return user_row["username"]
+
+
 class Driver(BaseLogger):
     """This module drives execution of the automation by
     instantiating an automator object and calling its methods"""
@@ -21,450 +102,436 @@ class Driver(BaseLogger):
         vars are defined in both places)
         """
         super().__init__(name="Driver", settings=settings)
-        self.net = NetworkUtility(settings=settings)
-        self.ip = self.net.get_public_ip()
-        self.info(
-            {
-                "method": "Driver.__init__",
-                "args": {"settings": "***"},
-                "message": "Initializing Driver",
-            }
+        # both are built lazily; misconfigured invocations that bail out in
+        # validation never pay the NetworkUtility construction or the IP fetch
+        self._net = None
+        self._automator = None
+        self.info_kv(
+            "Driver.__init__",
+            args={"settings": "***"},
+            message="Initializing Driver",
         )
 
-    def run_local(self, event, context) -> dict:
-        """Method to run the automation on a local server without AWS lambda.
-        Uses environment variables instead of lambda event to drive execution"""
-        self.info(
-            {
-                "method": "Driver.run_local",
-                "args": {"event": event, "context": context},
-                "message": "Running local execution with values from environment variables",
-            }
-        )
-        if self.settings["MODE"] == "single_user":
-            try:
-                # required variables are present
-                assert all(
-                    x is not None
-                    for x in [
-                        self.settings["SINGLE_USER_PASSWORD"],
-                        self.settings["SINGLE_USER_USERNAME"],
-                        self.settings["SINGLE_USER_CSV"],
-                    ]
-                )
-            except AssertionError as e:
-                self.error(
-                    {
-                        "method": "Driver.run_local",
-                        "message": "Missing required environment variables for single_user mode",
-                        "error": str(e),
-                    }
-                )
-                return {
-                    "statusCode": 500,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {
-                        "error": (
-                            "must provide SINGLE_USER_PASSWORD, "
-                            "SINGLE_USER_USERNAME, and SINGLE_USER_CSV "
-                            "as environment variables for single_user mode"
-                        ),
-                        "ip": self.ip,
-                    },
-                }
-            self.info(
-                {
-                    "method": "Driver.run_local",
-                    "message": "Creating automator with MODE=single_user",
-                }
+    def rebind(self, settings: dict) -> "Driver":
+        """Point this Driver (and any live collaborators) at a new per-event
+        settings dict. Warm invocations reuse one Driver instead of paying
+        reconstruction, and rebinding keeps event overrides effective.
+        Args:
+        settings (dict) - settings for the new event
+        Returns:
+        self (Driver) - for call chaining
+        """
+        self.settings = settings
+        if self._net is not None:
+            self._net.settings = settings
+        if self._automator is not None:
+            old = self._automator.settings
+            self._automator.settings = settings
+            if any(
+                old.get(k) != settings.get(k) for k in _CLIENT_SETTINGS_KEYS
+            ):
+                # the cached clients captured the previous region and
+                # credentials at construction; drop them so the next use
+                # lazily rebuilds against the new values
+                self._automator._s3_client = None
+                self._automator._gdrive_client = None
+        return self
+
+    @property
+    def net(self) -> NetworkUtility:
+        """NetworkUtility, constructed on first access."""
+        if self._net is None:
+            self._net = NetworkUtility(settings=self.settings)
+        return self._net
+
+    @property
+    def ip(self) -> str:
+        """Public IP of this container. NetworkUtility owns the TTL cache, so
+        repeated accesses within the rotation cooldown cost a dict lookup."""
+        return self.net.get_public_ip()
+
+    @property
+    def automator(self) -> BizBuySellAutomator:
+        """The shared BizBuySellAutomator, built on first use and kept for the
+        life of this Driver so repeated invocations reuse one browser instead
+        of paying Chrome startup each time; atexit tears it down at shutdown."""
+        if self._automator is None:
+            self._automator = BizBuySellAutomator(
+                network_utility=self.net, settings=self.settings
             )
-            try:
-                automator = BizBuySellAutomator(
-                    network_utility=self.net, settings=self.settings
-                )
-                automator.init_driver()
-                automator.automate_single_user_session(
-                    username=self.settings["SINGLE_USER_USERNAME"],
-                    password=self.settings["SINGLE_USER_PASSWORD"],
-                    csv_path=self.settings["SINGLE_USER_CSV"],
-                )
-                automator.quit()
-                return {
-                    "statusCode": 200,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {
-                        "success": (
-                            f"batch upload of {self.settings['SINGLE_USER_CSV']}"
-                            f" complete for single_user {self.settings['SINGLE_USER_USERNAME']}"
-                        ),
-                        "ip": self.ip,
-                    },
-                }
-            except TimeoutException as e:
-                self.error(
-                    {
-                        "method": "Driver.run_local",
-                        "message": "TimeoutException",
-                        "error": str(e),
-                    }
-                )
-                return {
-                    "statusCode": 500,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {"error": str(e), "ip": self.ip},
-                }
-            except Exception as e:
-                self.error(
-                    {
-                        "method": "Driver.run_local",
-                        "message": "Exception",
-                        "error": str(e),
-                    }
-                )
-                return {
-                    "statusCode": 500,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {"error": str(e), "ip": self.ip},
-                }
+            atexit.register(self._automator.quit)
+        return self._automator
 
-        elif self.settings["MODE"] == "multi_user":
-            try:
-                # required variable is present
-                assert self.settings["MULTI_USER_CSV"] is not None
-            except AssertionError as e:
-                self.error(
-                    {
-                        "method": "Driver.run_local",
-                        "message": "Missing required environment variables for multi_user mode",
-                        "error": str(e),
-                    }
-                )
-                return {
-                    "statusCode": 500,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {
-                        "error": (
-                            "must provide MULTI_USER_CSV as environment variable "
-                            "for multi_user mode - csv should include "
-                            "username,password,csv_path as columns"
-                        ),
-                        "ip": self.ip,
-                    },
+    def _run_multi_user_sessions(self, automator, multi_user_csv_path: str) -> list:
+        """Run every user session described by the multi-user CSV. With
+        MAX_WORKERS > 1 the rows are fanned out across a process pool where
+        each worker drives its own browser; otherwise the existing sequential
+        single-driver path is used.
+        Args:
+        automator (BizBuySellAutomator) - the automator already built by the caller
+        multi_user_csv_path (str) - local path to the username,password,csv_path CSV
+        Returns:
+        results (list) - per-user status dicts from the parallel path, or None
+        when the sequential path handled the rows
+        """
+        # parse the CSV exactly once here; both the sequential and the
+        # parallel path receive the already-materialized rows
+        # 1 MiB buffer: the default 8 KB read size leaves the parser
+        # syscall-bound on anything beyond a trivial CSV
+        with open(multi_user_csv_path, "r", buffering=1 << 20, newline="") as f:
+            rows = list(csv.DictReader(f))
+        max_workers = self.settings["MAX_WORKERS"]
+        if max_workers > 1 and self.settings.get("ENV") == "lambda":
+            # worker processes cannot start on AWS Lambda (no /dev/shm, so
+            # multiprocessing's SemLock creation fails with ENOSYS); fall
+            # back to the sequential path instead of failing the invocation
+            self.error_kv(
+                "Driver._run_multi_user_sessions",
+                message=(
+                    "MAX_WORKERS>1 is not supported on AWS Lambda; "
+                    "running user sessions sequentially"
+                ),
+            )
+            max_workers = 1
+        if max_workers <= 1:
+            automator.automate_multiple_user_sessions(
+                csv_file_path=multi_user_csv_path, rows=rows
+            )
+            return None
+        # never spin up more browsers than there are users
+        max_workers = min(max_workers, len(rows))
+        self.info_kv(
+            "Driver._run_multi_user_sessions",
+            args={"multi_user_csv_path": multi_user_csv_path},
+            message=f"Running {len(rows)} user sessions across {max_workers} workers",
+        )
+        # plain dict so the settings survive pickling into the workers
+        settings = dict(self.settings)
+        # prefetch every user's CSV in this process first - the downloads are
+        # network-bound and fan out well over threads - then hand the workers
+        # local paths (TEMP_FOLDER is shared with them) so no worker pays a
+        # per-user round-trip of its own
+        # prefetches are keyed by row index, not username: duplicate
+        # usernames with different csv_paths are valid rows and each must
+        # receive its own downloaded file
+        prefetched = {}
+        if settings["FILE_SOURCE"] in ("google_drive", "s3"):
+            with ThreadPoolExecutor(max_workers=16) as prefetcher:
+                csv_futures = {
+                    prefetcher.submit(
+                        automator._materialize_csv, row["csv_path"]
+                    ): i
+                    for i, row in enumerate(rows)
                 }
-            try:
-                self.info(
-                    {
-                        "method": "Driver.run_local",
-                        "message": "Creating automator with MODE=multi_user",
-                    }
-                )
-                automator = BizBuySellAutomator(
-                    network_utility=self.net, settings=self.settings
-                )
-                automator.init_driver()
-                if self.settings["FILE_SOURCE"] == "google_drive":
-                    # Download the CSV for multi-user execution
-                    # should be formatted as username,password,csv_path where
-                    # csv_path is the batch upload file for that user
-                    multi_user_csv_path = (
-                        automator.gdrive_client.download_file_from_google_drive(
-                            shared_link=self.settings["MULTI_USER_CSV"],
-                            temporary_filename="multi-user-tmp.csv",
-                        )
-                    )
-                elif self.settings["FILE_SOURCE"] == "local":
-                    # use the local FS path to the file; csv_path column should also specify local FS paths
-                    # for each user
-                    multi_user_csv_path = self.settings["MULTI_USER_CSV"]
-
-                elif self.settings["FILE_SOURCE"] == "s3":
+                for future in as_completed(csv_futures):
                     try:
-                        # required variable is present
-                        assert all(
-                            x is not None
-                            for x in [
-                                self.settings["AWS_S3_BUCKET"],
-                                self.settings["AWS_S3_REGION"],
-                            ]
-                        )
-                    except AssertionError as e:
-                        self.error(
-                            {
-                                "method": "Driver.run_local",
-                                "message": "Missing AWS S3 environment variables for multi_user mode",
-                                "error": str(e),
-                            }
-                        )
-                        return {
-                            "statusCode": 500,
-                            "headers": {"Content-Type": "application/json"},
-                            "body": {
-                                "error": (
-                                    "must provide AWS_S3_REGION and AWS_S3_BUCKET if"
-                                    " FILE_SOURCE=s3"
-                                ),
-                                "ip": self.ip,
-                            },
-                        }
-                    multi_user_csv_path = (
-                        automator.s3_client.download_file_from_s3_bucket(
-                            bucket_name=self.settings["AWS_S3_BUCKET"],
-                            file_key=self.settings["MULTI_USER_CSV"],
-                            temporary_filename="multi-user-tmp.csv",
+                        prefetched[csv_futures[future]] = future.result()
+                    except Exception as e:
+                        self.error_kv(
+                            "Driver._run_multi_user_sessions",
+                            message=(
+                                "CSV prefetch failed for user "
+                                f"{rows[csv_futures[future]]['username']}; "
+                                "worker will download"
+                            ),
+                            error=str(e),
                         )
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_pool_worker
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _run_one_user,
+                    settings,
+                    row,
+                    prefetched.get(i, ""),
+                ): row["username"]
+                for i, row in enumerate(rows)
+            }
+            # a failing user must not block or abort the others; collect a
+            # per-user status dict either way
+            for future in as_completed(futures):
+                username = futures[future]
+                try:
+                    future.result()
+                    results.append({"username": username, "status": "success"})
+                    self.info_kv(
+                        "Driver._run_multi_user_sessions",
+                        message=f"Completed session for user {username}",
+                    )
+                except Exception as e:
+                    results.append(
+                        {"username": username, "status": "error", "error": str(e)}
+                    )
+                    self.error_kv(
+                        "Driver._run_multi_user_sessions",
+                        message=f"Session failed for user {username}",
+                        error=str(e),
                     )
+        # prefetched copies are temp files owned by this process
+        for path in prefetched.values():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        return results
 
-                automator.automate_multiple_user_sessions(
-                    csv_file_path=multi_user_csv_path
-                )
-                automator.quit()
-                return {
-                    "statusCode": 200,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {"success": (f"batch uploads complete for multiple users")},
-                }
-            except TimeoutException as e:
-                self.error(
-                    {
-                        "method": "Driver.run_local",
-                        "message": "TimeoutException in multi_user mode",
-                        "error": str(e),
-                    }
-                )
-                return {
-                    "statusCode": 500,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {"error": str(e), "ip": self.ip},
-                }
-            except Exception as e:
-                self.error(
-                    {
-                        "method": "Driver.run_local",
-                        "message": "Exception in multi_user mode",
-                        "error": str(e),
-                    }
-                )
-                return {
-                    "statusCode": 500,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {"error": str(e), "ip": self.ip},
-                }
+    # shared by every response; one allocation for the life of the process
+    _JSON_HEADERS = {"Content-Type": "application/json"}
 
-    def run_lambda(self, event, context) -> None:
+    def _ok(self, body: dict) -> dict:
+        """Build a 200 JSON response envelope around body."""
+        return {
+            "statusCode": 200,
+            "headers": self._JSON_HEADERS,
+            "body": body,
+        }
+
+    def _err(self, error: str, status_code: int = 500) -> dict:
+        """Build an error JSON response for error with the current public IP."""
+        return {
+            "statusCode": status_code,
+            "headers": self._JSON_HEADERS,
+            "body": {"error": error, "ip": self.ip},
+        }
+
+    def run_local(self, event, context) -> dict:
+        """Method to run the automation on a local server without AWS lambda.
+        Uses environment variables instead of lambda event to drive execution"""
+        self.info_kv(
+            "Driver.run_local",
+            args={"event": event, "context": context},
+            message="Running local execution with values from environment variables",
+        )
+        return self._run(method="Driver.run_local")
+
+    def run_lambda(self, event, context) -> dict:
         """Run automation with AWS lambda using event to drive execution"""
-        self.info(
-            {
-                "method": "Driver.run_lambda",
-                "message": "Running AWS Lambda execution with values from event",
-            }
+        self.info_kv(
+            "Driver.run_lambda",
+            message="Running AWS Lambda execution with values from event",
         )
-        # Try to pull args from event first. If not present in event, then try environment variables.
-        if self.settings["MODE"] == "single_user":
-            try:
-                # Required single user variables must be present
-                assert all(
-                    self.settings[f"SINGLE_USER_{x}"] is not None
-                    for x in ["USERNAME", "PASSWORD", "CSV"]
-                )
-            except AssertionError as e:
-                self.error(
-                    {
-                        "method": "Driver.run_lambda",
-                        "message": "Missing required environment variables for single_user mode",
-                        "error": str(e),
-                    }
-                )
-                return {
-                    "statusCode": 500,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {
-                        "error": (
-                            "must provide SINGLE_USER_PASSWORD, "
-                            "SINGLE_USER_USERNAME, and SINGLE_USER_CSV "
-                            "in body for single_user mode"
-                        ),
-                        "ip": self.ip,
-                    },
-                }
-            try:
-                self.info(
-                    {
-                        "method": "Driver.run_lambda",
-                        "message": "Creating automator with MODE=single_user",
-                    }
-                )
-                automator = BizBuySellAutomator(
-                    network_utility=self.net, settings=self.settings
-                )
+        return self._run(method="Driver.run_lambda")
+
+    def _run(self, method: str) -> dict:
+        """Dispatch to the handler for the configured MODE. run_local and
+        run_lambda used to carry near-identical copies of every branch; both
+        now funnel through this single table.
+        Args:
+        method (str) - the public entry point name, used in log records
+        """
+        handler = self._MODE_HANDLERS.get(self.settings["MODE"])
+        if handler is None:
+            return None
+        return handler(self, method)
+
+    def _validate(self, mode: str, method: str) -> dict:
+        """Check the precompiled required-settings table for mode (including
+        any extra keys its FILE_SOURCE demands) before anything expensive runs.
+        Args:
+        mode (str) - MODE being dispatched
+        method (str) - the public entry point name, used in log records
+        Returns:
+        response (dict) - None when valid, otherwise an error response
+        """
+        keys = (
+            _REQUIRED_SETTINGS.get((mode, self.settings["FILE_SOURCE"]))
+            or _REQUIRED_SETTINGS[mode]
+        )
+        # explicit check rather than assert: asserts are stripped under
+        # python -O, which would let a misconfigured invocation launch
+        # Chrome only to fail deep inside Selenium
+        missing = [k for k in keys if self.settings.get(k) is None]
+        if not missing:
+            return None
+        self.error_kv(
+            method,
+            message=f"Missing required variables for {mode} mode: {', '.join(missing)}",
+        )
+        return self._err(
+            f"must provide {', '.join(missing)} (via event or environment) "
+            f"for {mode} mode{_REQUIRED_HINTS.get(mode, '')}"
+        )
+
+    def _discard_wedged_driver(self) -> None:
+        """Force-quit the shared automator's browser after a failed session.
+        The driver may be hung; leaving it attached (or parked in the warm
+        cache) would make every later warm invocation in this container
+        inherit it and fail until the container is recycled."""
+        try:
+            if self._automator is not None:
+                self._automator.quit(force=True)
+        except Exception:
+            pass
+
+    def _run_single_user(self, method: str) -> dict:
+        """Run one user's batch upload using the SINGLE_USER_* settings."""
+        err = self._validate("single_user", method)
+        if err:
+            return err
+        # bind the repeated settings reads to locals once; each subscript
+        # is otherwise an attribute load plus dict lookup per use
+        settings = self.settings
+        username = settings["SINGLE_USER_USERNAME"]
+        password = settings["SINGLE_USER_PASSWORD"]
+        csv_path = settings["SINGLE_USER_CSV"]
+        try:
+            self.info_kv(
+                method,
+                message="Creating automator with MODE=single_user",
+            )
+            automator = self.automator
+            if getattr(automator, "driver", None) is None:
                 automator.init_driver()
-                automator.automate_single_user_session(
-                    username=self.settings["SINGLE_USER_USERNAME"],
-                    password=self.settings["SINGLE_USER_PASSWORD"],
-                    csv_path=self.settings["SINGLE_USER_CSV"],
-                )
-                automator.quit()
-                return {
-                    "statusCode": 200,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {
-                        "success": (
-                            f'batch upload of {self.settings["SINGLE_USER_CSV"]}'
-                            f" complete for single_user {self.settings['SINGLE_USER_USERNAME']}"
-                        ),
-                        "ip": self.ip,
-                    },
-                }
-            except TimeoutException as e:
-                self.error(
-                    {
-                        "method": "Driver.run_lambda",
-                        "message": "TimeoutException in single_user mode",
-                        "error": str(e),
-                    }
-                )
-                return {
-                    "statusCode": 500,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {"error": str(e), "ip": self.ip},
-                }
-            except Exception as e:
-                self.error(
-                    {
-                        "method": "Driver.run_lambda",
-                        "message": "Exception in single_user mode",
-                        "error": str(e),
-                    }
+            automator.automate_single_user_session(
+                username=username,
+                password=password,
+                csv_path=csv_path,
+            )
+            # the session is already cleared; keep the driver attached so the
+            # next invocation in this container skips browser startup
+            body = {
+                "success": (
+                    f"batch upload of {csv_path}"
+                    f" complete for single_user {username}"
                 )
-                return {
-                    "statusCode": 500,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {"error": str(e), "ip": self.ip},
-                }
+            }
+            if settings.get("INCLUDE_IP_IN_RESPONSE"):
+                body["ip"] = self.ip
+            return self._ok(body)
+        except TimeoutException as e:
+            self.error_kv(
+                method,
+                message="TimeoutException in single_user mode",
+                error=str(e),
+            )
+            self._discard_wedged_driver()
+            return self._err(str(e))
+        except Exception as e:
+            self.exception({"method": method, "message": "Exception in single_user mode"})
+            self._discard_wedged_driver()
+            return self._err(str(e))
 
-        elif self.settings["MODE"] == "multi_user":
-            try:
-                assert self.settings["MULTI_USER_CSV"] is not None
-            except AssertionError as e:
-                self.error(
-                    {
-                        "method": "Driver.run_lambda",
-                        "message": "Missing required environment variables for multi_user mode",
-                        "error": str(e),
-                    }
-                )
-                return {
-                    "statusCode": 500,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {
-                        "error": (
-                            "must provide MULTI_USER_CSV in body "
-                            "for multi_user_mode - csv should include "
-                            "username,password,csv_path as columns"
-                        ),
-                        "ip": self.ip,
-                    },
-                }
-            try:
-                self.info(
-                    {
-                        "method": "Driver.run_lambda",
-                        "message": "Creating automator with MODE=multi_user",
-                    }
-                )
-                automator = BizBuySellAutomator(
-                    network_utility=self.net, settings=self.settings
-                )
-                automator.init_driver()
-                if self.settings["FILE_SOURCE"] == "google_drive":
-                    # Download the CSV for multi-user execution
-                    # should be formatted as username,password,csv_path where
-                    # csv_path is the batch upload file for that user
-                    multi_user_csv_path = (
-                        automator.gdrive_client.download_file_from_google_drive(
-                            shared_link=self.settings["MULTI_USER_CSV"],
-                            temporary_filename="multi-user-tmp.csv",
-                        )
-                    )
-                elif self.settings["FILE_SOURCE"] == "local":
-                    # use the local FS path to the file; csv_path column should also specify local FS paths
-                    # for each user
-                    multi_user_csv_path = self.settings["MULTI_USER_CSV"]
+    def _fetch_csv_gdrive(self, automator) -> str:
+        """Download MULTI_USER_CSV from Google Drive; returns the local path."""
+        return automator.gdrive_client.download_file_from_google_drive(
+            shared_link=self.settings["MULTI_USER_CSV"],
+            temporary_filename="multi-user-tmp.csv",
+        )
 
-                elif self.settings["FILE_SOURCE"] == "s3":
-                    try:
-                        # required variable is present
-                        assert all(
-                            x is not None
-                            for x in [
-                                self.settings["AWS_S3_BUCKET"],
-                                self.settings["AWS_S3_REGION"],
-                            ]
-                        )
-                    except AssertionError as e:
-                        self.error(
-                            {
-                                "method": "Driver.run_lambda",
-                                "message": "Missing AWS S3 environment variables for multi_user mode",
-                                "error": str(e),
-                            }
-                        )
-                        return {
-                            "statusCode": 500,
-                            "headers": {"Content-Type": "application/json"},
-                            "body": {
-                                "error": (
-                                    "must provide AWS_S3_REGION and AWS_S3_BUCKET if"
-                                    " FILE_SOURCE=s3"
-                                ),
-                                "ip": self.ip,
-                            },
-                        }
-                    multi_user_csv_path = (
-                        automator.s3_client.download_file_from_s3_bucket(
-                            bucket_name=self.settings["AWS_S3_BUCKET"],
-                            file_key=self.settings["MULTI_USER_CSV"],
-                            temporary_filename="multi-user-tmp.csv",
-                        )
-                    )
+    def _fetch_csv_s3(self, automator) -> str:
+        """Download MULTI_USER_CSV from S3; returns the local path."""
+        return automator.s3_client.download_file_from_s3_bucket(
+            bucket_name=self.settings["AWS_S3_BUCKET"],
+            file_key=self.settings["MULTI_USER_CSV"],
+            temporary_filename="multi-user-tmp.csv",
+        )
 
-                automator.automate_multiple_user_sessions(
-                    csv_file_path=multi_user_csv_path
-                )
-                automator.quit()
-                return {
-                    "statusCode": 200,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {
-                        "success": (f"batch uploads complete for multiple users"),
-                        "ip": self.ip,
-                    },
-                }
-            except TimeoutException as e:
-                self.error(
-                    {
-                        "method": "Driver.run_lambda",
-                        "message": "TimeoutException in multi_user mode",
-                        "error": str(e),
-                    }
-                )
-                return {
-                    "statusCode": 500,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {"error": str(e), "ip": self.ip},
-                }
-            except Exception as e:
-                self.error(
-                    {
-                        "method": "Driver.run_lambda",
-                        "message": "Exception in multi_user mode",
-                        "error": str(e),
-                    }
+    # FILE_SOURCE -> fetcher; one lookup replaces the per-source if/elif
+    # ladder that used to be copy-pasted into every handler
+    _CSV_FETCHERS = {
+        "google_drive": _fetch_csv_gdrive,
+        "s3": _fetch_csv_s3,
+    }
+
+    def _resolve_multi_user_csv(self, automator) -> str:
+        """Resolve MULTI_USER_CSV to a local path for the configured
+        FILE_SOURCE, caching downloads on disk keyed by the source. Lambda's
+        /tmp (TEMP_FOLDER) persists across warm invocations, so repeat events
+        for the same CSV skip the download; for S3 the object's ETag is kept
+        in a sidecar file and the cache is invalidated when the remote changed.
+        Args:
+        automator (BizBuySellAutomator) - supplies the gdrive/s3 clients
+        Returns:
+        multi_user_csv_path (str) - local path to the multi-user CSV
+        """
+        settings = self.settings
+        source = settings["FILE_SOURCE"]
+        multi_user_csv = settings["MULTI_USER_CSV"]
+        if source not in ("google_drive", "s3"):
+            # local; csv_path column should also specify local FS paths for each user
+            return multi_user_csv
+        # the CSV for multi-user execution should be formatted as
+        # username,password,csv_path where csv_path is the batch upload
+        # file for that user
+        cache_key = hashlib.sha1(f"{source}:{multi_user_csv}".encode()).hexdigest()
+        cached_path = os.path.join(
+            settings["TEMP_FOLDER"], f"mucsv_{cache_key}.csv"
+        )
+        etag_path = cached_path + ".etag"
+        etag = None
+        if source == "s3":
+            etag = automator.s3_client.get_file_etag(
+                bucket_name=settings["AWS_S3_BUCKET"],
+                file_key=multi_user_csv,
+            )
+        if os.path.exists(cached_path):
+            if source == "google_drive":
+                # no change detector for Drive links; reuse what we have
+                return cached_path
+            try:
+                with open(etag_path, "r") as f:
+                    if etag is not None and f.read() == etag:
+                        return cached_path
+            except OSError:
+                pass
+        downloaded = self._CSV_FETCHERS[source](self, automator)
+        # rename into place atomically so a crashed invocation never leaves
+        # a half-written cache entry behind
+        os.replace(downloaded, cached_path)
+        if etag is not None:
+            with open(etag_path, "w") as f:
+                f.write(etag)
+        return cached_path
+
+    def _run_multi_user(self, method: str) -> dict:
+        """Run batch uploads for every user listed in the multi-user CSV."""
+        err = self._validate("multi_user", method)
+        if err:
+            return err
+        try:
+            self.info_kv(
+                method,
+                message="Creating automator with MODE=multi_user",
+            )
+            automator = self.automator
+            # the CSV download and Chrome startup are independent; overlap
+            # them so the invocation only waits for the slower of the two
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                csv_future = executor.submit(
+                    self._resolve_multi_user_csv, automator
                 )
-                return {
-                    "statusCode": 500,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {"error": str(e), "ip": self.ip},
-                }
+                if getattr(automator, "driver", None) is None:
+                    automator.init_driver()
+                multi_user_csv_path = csv_future.result()
+            results = self._run_multi_user_sessions(
+                automator, multi_user_csv_path=multi_user_csv_path
+            )
+            # per-user sessions were cleared as they finished; keep the
+            # driver attached for the next invocation in this container
+            body = {"success": (f"batch uploads complete for multiple users")}
+            if self.settings.get("INCLUDE_IP_IN_RESPONSE"):
+                body["ip"] = self.ip
+            if results is not None:
+                body["users"] = results
+            return self._ok(body)
+        except TimeoutException as e:
+            self.error_kv(
+                method,
+                message="TimeoutException in multi_user mode",
+                error=str(e),
+            )
+            return self._err(str(e))
+        except Exception as e:
+            self.exception({"method": method, "message": "Exception in multi_user mode"})
+            return self._err(str(e))
+
+    # MODE -> handler; looked up once per invocation in _run
+    _MODE_HANDLERS = {
+        "single_user": _run_single_user,
+        "multi_user": _run_multi_user,
+    }
 
     def handle_s3_trigger_single_user_mode(
         self, s3_bucket: str = "", s3_updated_file_key: str = ""
@@ -478,80 +545,68 @@ class Driver(BaseLogger):
         s3_bucket (str) - name of bucket where file was updated
         s3_updated_file_key (str) - key (location or path) of file updated
         """
-        self.info(
-            {
-                "method": "Driver.handle_s3_trigger_single_user_mode",
-                "args": {
-                    "s3_bucket": s3_bucket,
-                    "s3_updated_file_key": s3_updated_file_key,
-                },
-                "message": "Handling S3 trigger for single_user mode",
-            }
+        self.info_kv(
+            "Driver.handle_s3_trigger_single_user_mode",
+            args={
+                "s3_bucket": s3_bucket,
+                "s3_updated_file_key": s3_updated_file_key,
+            },
+            message="Handling S3 trigger for single_user mode",
         )
         self.settings["MODE"] = "single_user"
         try:
-            self.info(
-                {
-                    "method": "Driver.handle_s3_trigger_single_user_mode",
-                    "message": "Running single_user mode for file updated in S3",
-                }
-            )
-            automator = BizBuySellAutomator(
-                network_utility=self.net,
-                settings=self.settings,
-                s3_updated_file_key=s3_updated_file_key,
+            self.info_kv(
+                "Driver.handle_s3_trigger_single_user_mode",
+                message="Running single_user mode for file updated in S3",
             )
-            automator.init_driver()
+            automator = self.automator
+            automator.s3_updated_file_key = s3_updated_file_key
+            if getattr(automator, "driver", None) is None:
+                automator.init_driver()
             creds_for_file = automator.get_creds_for_csv_file(
                 csv_file_path=s3_updated_file_key
             )
-            assert creds_for_file is not None
-            self.info(
-                {
-                    "method": "Driver.handle_s3_trigger_single_user_mode",
-                    "message": f"Found creds for {s3_updated_file_key}; automating user session for user {creds_for_file['username']}",
-                }
+            if creds_for_file is None:
+                self.error_kv(
+                    "Driver.handle_s3_trigger_single_user_mode",
+                    message=f"No credentials found for {s3_updated_file_key}",
+                )
+                return self._err(
+                    f"no credentials found for file {s3_updated_file_key} "
+                    "in CREDENTIALS_FILE"
+                )
+            self.info_kv(
+                "Driver.handle_s3_trigger_single_user_mode",
+                message=f"Found creds for {s3_updated_file_key}; automating user session for user {creds_for_file['username']}",
             )
             automator.automate_single_user_session(
                 username=creds_for_file["username"],
                 password=creds_for_file["password"],
                 csv_path=s3_updated_file_key,
             )
-            automator.quit()
-            return {
-                "statusCode": 200,
-                "headers": {"Content-Type": "application/json"},
-                "body": {
-                    "success": (
-                        f"batch upload of {s3_updated_file_key} complete"
-                        f"for single_user {creds_for_file['username']}"
-                    ),
-                    "ip": self.ip,
-                },
+            body = {
+                "success": (
+                    f"batch upload of {s3_updated_file_key} complete"
+                    f"for single_user {creds_for_file['username']}"
+                )
             }
+            if self.settings.get("INCLUDE_IP_IN_RESPONSE"):
+                body["ip"] = self.ip
+            return self._ok(body)
         except TimeoutException as e:
-            self.error(
-                {
-                    "method": "Driver.handle_s3_trigger_single_user_mode",
-                    "message": "TimeoutException in single_user mode",
-                    "error": str(e),
-                }
+            self.error_kv(
+                "Driver.handle_s3_trigger_single_user_mode",
+                message="TimeoutException in single_user mode",
+                error=str(e),
             )
-            return {
-                "statusCode": 500,
-                "headers": {"Content-Type": "application/json"},
-                "body": {"error": str(e), "ip": self.ip},
-            }
+            self._discard_wedged_driver()
+            return self._err(str(e))
         except Exception as e:
-            self.error(
+            self.exception(
                 {
                     "method": "Driver.handle_s3_trigger_single_user_mode",
                     "message": "Exception in single_user mode",
-                    "error": str(e),
                 }
             )
-            return {
-                "statusCode": 500,
-                "headers": {"Content-Type": "application/json"},
-                "body": {"error": str(e), "ip": self.ip},
-            }
+            self._discard_wedged_driver()
+            return self._err(str(e))
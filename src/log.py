@@ -1,55 +1,197 @@
-import io
-import logging
-import json
-
-""" Parent class inherited by other classes for handling logging """
-
-
-class BaseLogger:
-    def __init__(self, name: str = "", settings: dict = {}):
-        """
-        Args:
-        name (str) - name for this instance, will appear as a prefix in log statements
-        settings (dict) - settings parsed from a combination of a lambda event and
-        the environment variables (with priority given to lambda event in cases where
-        vars are defined in both places)
-        """
-        self.name = name
-        self.settings = settings
-        self.setup_logging()
-
-    def setup_logging(self) -> None:
-        """set up self.logger for Driver logging
-        Args:
-        name (str) - what this object should be called, will be used as logging prefix
-        """
-        self.logger = logging.getLogger(self.name)
-        self.logger.propagate = False
-        level = logging.DEBUG if self.settings["VERBOSE"] else logging.INFO
-        self.logger.setLevel(level)
-
-        if self.logger.hasHandlers():
-            self.logger.handlers.clear()
-        format = "[%(prefix)s - %(filename)s:%(lineno)s - %(funcName)3s() ] %(message)s"
-        formatter = logging.Formatter(format)
-        # Normal logging. Will show up in console or docker logs or
-        # in AWS Cloudtrail logs if running in AWS.
-        handlerStream = logging.StreamHandler()
-        handlerStream.setFormatter(formatter)
-        self.logger.addHandler(handlerStream)
-
-    def debug(self, msg) -> None:
-        if isinstance(msg, dict):
-            msg = json.dumps(msg)
-
-        self.logger.debug(msg, extra={"prefix": self.name})
-
-    def info(self, msg) -> None:
-        if isinstance(msg, dict):
-            msg = json.dumps(msg)
-        self.logger.info(msg, extra={"prefix": self.name})
-
-    def error(self, msg) -> None:
-        if isinstance(msg, dict):
-            msg = json.dumps(msg)
-        self.logger.error(msg, extra={"prefix": self.name})
+import atexit
+import io
+import logging
+import logging.handlers
+import json
+import queue
+
+try:
+    # C-accelerated serializer, ~5-10x faster on the structured payload
+    # dicts every log call dumps; purely optional, the image need not
+    # ship it
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _dumps = json.dumps
+
+""" Parent class inherited by other classes for handling logging """
+
+
+# all loggers enqueue records into one shared queue drained by a single
+# background listener thread; emitting to stderr then never blocks the
+# threads (or the Selenium waits) doing the actual work
+_LOG_QUEUE = None
+_LOG_LISTENER = None
+_MEMORY_HANDLER = None
+_LOG_FORMAT = "[%(prefix)s - %(filename)s:%(lineno)s - %(funcName)3s() ] %(message)s"
+# parsed once at import; Formatter construction compiles the format string,
+# which multi_user mode would otherwise repeat per BaseLogger instance
+_FORMATTER = logging.Formatter(_LOG_FORMAT)
+# logger names whose level/propagate/handler setup has already run; named
+# loggers are process-wide singletons, so the work never needs repeating
+_INITIALIZED = set()
+
+
+def _shutdown_logging():
+    """Stop the listener, then push any batched records out to stderr.
+    Idempotent: forked workers inherit the parent's atexit registration and
+    add their own after the post-fork reset, so this can run twice in one
+    process."""
+    global _LOG_LISTENER
+    listener, _LOG_LISTENER = _LOG_LISTENER, None
+    if listener is not None:
+        try:
+            listener.stop()
+        except Exception:
+            pass
+    if _MEMORY_HANDLER is not None:
+        _MEMORY_HANDLER.flush()
+
+
+def _get_log_queue():
+    """Return the shared log queue, starting its listener on first use."""
+    global _LOG_QUEUE, _LOG_LISTENER, _MEMORY_HANDLER
+    if _LOG_QUEUE is None:
+        _LOG_QUEUE = queue.SimpleQueue()
+        # Normal logging. Will show up in console or docker logs or
+        # in AWS Cloudtrail logs if running in AWS.
+        handlerStream = logging.StreamHandler()
+        handlerStream.setFormatter(_FORMATTER)
+        # batch stderr writes: records accumulate in memory and flush on
+        # ERROR, at capacity, or via flush_logs at the end of a handler,
+        # amortizing the write syscalls across many log calls
+        _MEMORY_HANDLER = logging.handlers.MemoryHandler(
+            capacity=512,
+            flushLevel=logging.ERROR,
+            target=handlerStream,
+            flushOnClose=True,
+        )
+        _LOG_LISTENER = logging.handlers.QueueListener(
+            _LOG_QUEUE, _MEMORY_HANDLER, respect_handler_level=True
+        )
+        _LOG_LISTENER.start()
+        # flush whatever is still queued or batched when the process exits
+        atexit.register(_shutdown_logging)
+    return _LOG_QUEUE
+
+
+def _reset_after_fork():
+    """Forget the parent's logging state in a forked child. The listener
+    thread does not survive the fork, so records enqueued on the inherited
+    queue would never be drained; clearing these globals (and the
+    initialized-name sentinels) makes the child's first BaseLogger start a
+    listener of its own."""
+    global _LOG_QUEUE, _LOG_LISTENER, _MEMORY_HANDLER
+    _LOG_QUEUE = None
+    _LOG_LISTENER = None
+    _MEMORY_HANDLER = None
+    _INITIALIZED.clear()
+
+
+def flush_logs():
+    """Push batched log records out to stderr. Lambda handlers call this in
+    a finally block so each invocation's records reach CloudWatch before the
+    container freezes."""
+    if _MEMORY_HANDLER is not None:
+        _MEMORY_HANDLER.flush()
+
+
+class BaseLogger:
+    def __init__(self, name: str = "", settings: dict = {}):
+        """
+        Args:
+        name (str) - name for this instance, will appear as a prefix in log statements
+        settings (dict) - settings parsed from a combination of a lambda event and
+        the environment variables (with priority given to lambda event in cases where
+        vars are defined in both places)
+        """
+        self.name = name
+        self.settings = settings
+        self.setup_logging()
+
+    def setup_logging(self) -> None:
+        """set up self.logger for Driver logging
+        Args:
+        name (str) - what this object should be called, will be used as logging prefix
+        """
+        base = logging.getLogger(self.name)
+        # a later instance of an already-configured name (multi_user mode
+        # builds many) skips straight to the adapter: no propagate/level
+        # writes, no handler-list scans or mutation
+        if self.name not in _INITIALIZED:
+            base.propagate = False
+            level = logging.DEBUG if self.settings["VERBOSE"] else logging.INFO
+            base.setLevel(level)
+            if base.hasHandlers():
+                base.handlers.clear()
+            # log calls only enqueue the record; the shared listener thread
+            # formats and writes it to stderr off the caller's critical path
+            base.addHandler(logging.handlers.QueueHandler(_get_log_queue()))
+            _INITIALIZED.add(self.name)
+        # the adapter injects the prefix from one shared dict instead of a
+        # fresh extra={...} allocation on every log call
+        self.logger = logging.LoggerAdapter(base, {"prefix": self.name})
+
+    def info_kv(self, method: str, **kw) -> None:
+        """Log a structured INFO record without paying for the payload when
+        INFO is disabled; the dict build and json.dumps only happen if the
+        record would actually be emitted.
+        Args:
+        method (str) - calling method name, becomes the payload's method key
+        kw - remaining payload fields (message, args, error, ...)
+        """
+        if self.logger.isEnabledFor(logging.INFO):
+            self.info({"method": method, **kw})
+
+    def error_kv(self, method: str, **kw) -> None:
+        """ERROR-level counterpart of info_kv."""
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.error({"method": method, **kw})
+
+    def debug(self, msg) -> None:
+        """msg may be a str, a dict, or a zero-arg callable returning either;
+        callables let callers defer building expensive payloads until the
+        level check has passed. Same contract for info/error below."""
+        # DEBUG is usually suppressed; skip the payload work entirely then
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        if callable(msg):
+            msg = msg()
+        if isinstance(msg, dict):
+            msg = _dumps(msg)
+
+        self.logger.debug(msg)
+
+    def info(self, msg) -> None:
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        if callable(msg):
+            msg = msg()
+        if isinstance(msg, dict):
+            msg = _dumps(msg)
+        self.logger.info(msg)
+
+    def error(self, msg) -> None:
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        if callable(msg):
+            msg = msg()
+        if isinstance(msg, dict):
+            msg = _dumps(msg)
+        self.logger.error(msg)
+
+    def flush(self) -> None:
+        """Flush this process's batched log records (see flush_logs)."""
+        flush_logs()
+
+    def exception(self, msg) -> None:
+        """Log msg at ERROR with the active exception's traceback attached.
+        The traceback is rendered lazily by the logging framework, only when
+        the record is actually emitted - unlike traceback.format_exc, which
+        walks and formats the stack unconditionally."""
+        if isinstance(msg, dict):
+            msg = _dumps(msg)
+        self.logger.exception(msg)
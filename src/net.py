@@ -1,71 +1,91 @@
-""" Module responsible for changing IP address for the production environment
-by leveraging NAT gateways and Elastic IP assignment to an AWS Function within
-the context of that AWS function """
-
-import requests
-from log import BaseLogger
-
-
-class NetworkUtility(BaseLogger):
-    def __init__(self, settings: dict = {}):
-        """
-        Args:
-        settings (dict) - settings parsed from a combination of a lambda event and
-        the environment variables (with priority given to lambda event in cases where
-        vars are defined in both places)
-        """
-        super().__init__(name="NetUtil", settings=settings)
-        self.info(
-            {
-                "method": "NetworkUtility.__init__",
-                "args": {"settings": "***"},
-                "message": "Initializing NetworkUtility",
-            }
-        )
-
-    def get_public_ip(self):
-        """Pull the public IP address of the device running this program
-        Args: none
-        Returns:
-        ip (str) - public IP address of this device
-        """
-        self.info(
-            {
-                "method": "get_public_ip",
-                "args": {},
-                "message": "Getting public IP address",
-            }
-        )
-        try:
-            response = requests.get("https://api64.ipify.org?format=json", timeout=3)
-            ip = response.json().get("ip")
-            self.info(
-                {
-                    "method": "get_public_ip",
-                    "args": {},
-                    "message": f"Got public IP address: {ip}",
-                }
-            )
-            return ip
-        except requests.exceptions.Timeout as e:
-            self.error(
-                {
-                    "method": "get_public_ip",
-                    "args": {},
-                    "message": f"Timeout error: {e}",
-                }
-            )
-            return None
-        except requests.RequestException as e2:
-            self.error(
-                {
-                    "method": "get_public_ip",
-                    "args": {},
-                    "message": f"Request error: {e2}",
-                }
-            )
-            return None
-
-    # make printable
-    def __str__(self):
-        return f"NetworkUtility"
+""" Module responsible for changing IP address for the production environment
+by leveraging NAT gateways and Elastic IP assignment to an AWS Function within
+the context of that AWS function """
+
+import json
+import os
+import time
+
+import urllib3
+from log import BaseLogger
+
+# one pooled manager per container: keep-alive + TLS session reuse means
+# only the first get_public_ip call in a warm container pays the TCP/TLS
+# handshake to ipify. urllib3 directly (rather than through requests)
+# skips the per-call session/cookie-jar/hook machinery this lookup never
+# uses
+_POOL = urllib3.PoolManager(num_pools=1, maxsize=2, timeout=3.0)
+
+# the container's public IP only changes when update_function_code rotates
+# the function (a >=30s cooldown applies), so cache the last answer just
+# under that window and skip the HTTPS round-trip on warm lookups
+_IP_TTL_SECONDS = 25.0
+_IP_CACHE = {"ip": None, "ts": 0.0}
+
+# deployments behind a NAT gateway with a single Elastic IP can bake the
+# address into the image/function config at deploy time; when present it
+# makes get_public_ip a plain attribute read with no network at all. The
+# environment is immutable for the life of the process, so snapshot once.
+_DEPLOY_IP = os.environ.get("LAMBDA_PUBLIC_IP")
+
+
+def invalidate_ip_cache() -> None:
+    """Drop the cached public IP. Called after update_function_code succeeds
+    so the next lookup reflects the post-rotation address."""
+    _IP_CACHE["ip"] = None
+
+
+class NetworkUtility(BaseLogger):
+    def __init__(self, settings: dict = {}):
+        """
+        Args:
+        settings (dict) - settings parsed from a combination of a lambda event and
+        the environment variables (with priority given to lambda event in cases where
+        vars are defined in both places)
+        """
+        super().__init__(name="NetUtil", settings=settings)
+        self.info_kv(
+            "NetworkUtility.__init__",
+            args={"settings": "***"},
+            message="Initializing NetworkUtility",
+        )
+
+    def get_public_ip(self):
+        """Pull the public IP address of the device running this program
+        Args: none
+        Returns:
+        ip (str) - public IP address of this device
+        """
+        # tiered lookup: deploy-time constant, then the TTL cache, and only
+        # then the HTTPS round-trip to ipify
+        if _DEPLOY_IP:
+            return _DEPLOY_IP
+        ip = _IP_CACHE["ip"]
+        if ip is not None and time.monotonic() - _IP_CACHE["ts"] < _IP_TTL_SECONDS:
+            return ip
+        self.info_kv("get_public_ip", args={}, message="Getting public IP address")
+        try:
+            response = _POOL.request("GET", "https://api64.ipify.org?format=json")
+            ip = json.loads(response.data).get("ip")
+            _IP_CACHE["ip"] = ip
+            _IP_CACHE["ts"] = time.monotonic()
+            self.info(
+                lambda: {
+                    "method": "get_public_ip",
+                    "args": {},
+                    "message": f"Got public IP address: {ip}",
+                }
+            )
+            return ip
+        except urllib3.exceptions.TimeoutError:
+            # exception() attaches the traceback lazily, rendered on the
+            # listener thread only if a handler consumes the record
+            self.exception({"method": "get_public_ip", "message": "Timeout error"})
+            return None
+        except (urllib3.exceptions.HTTPError, ValueError):
+            self.exception({"method": "get_public_ip", "message": "Request error"})
+            return None
+
+    # make printable
+    def __str__(self):
+        return f"NetworkUtility"